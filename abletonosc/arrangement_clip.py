@@ -1,6 +1,135 @@
-from typing import Tuple, Any
+from typing import Tuple, Any, List, Optional
 from .handler import AbletonOSCHandler
 import Live
+import bisect
+import traceback
+from itertools import chain
+from operator import attrgetter
+
+_get_note_attributes = attrgetter("pitch", "start_time", "duration", "velocity", "mute")
+_MidiNoteSpec = Live.Clip.MidiNoteSpecification
+
+_PROPERTIES_R = (
+    "start_time",
+    "end_time",
+    "length",
+    "is_midi_clip",
+    "color",
+)
+_PROPERTIES_RW = (
+    "name",
+    "loop_start",
+    "loop_end",
+    "start_marker",
+    "end_marker",
+    "looping",
+)
+
+#--------------------------------------------------------------------------------
+# Integer IDs for each property, indexing into a parallel tuple of precompiled
+# attrgetters, so that getters don't need to look properties up by name.
+#--------------------------------------------------------------------------------
+_PROPERTY_NAMES = _PROPERTIES_R + _PROPERTIES_RW
+_PROPERTY_IDS = {prop: prop_id for prop_id, prop in enumerate(_PROPERTY_NAMES)}
+_PROPERTY_GETTERS = tuple(attrgetter(prop) for prop in _PROPERTY_NAMES)
+
+#--------------------------------------------------------------------------------
+# (verb, handler method name, pass_clip_index, writable properties only)
+#--------------------------------------------------------------------------------
+_PROPERTY_VERBS = (
+    ("get", "_get_property_by_id", False, False),
+    ("start_listen", "_start_listen", True, False),
+    ("stop_listen", "_stop_listen", True, False),
+    ("set", "_set_property", False, True),
+)
+
+def _build_property_handlers() -> Tuple:
+    """
+    Returns (address, handler method name, args, pass_clip_index) for every property
+    handler. Expanded once at module load so that init_api() is a single flat loop.
+
+    Getters are passed the property's integer ID rather than its name.
+    """
+    handlers = []
+    for verb, method_name, pass_clip_index, writable_only in _PROPERTY_VERBS:
+        for prop in (_PROPERTIES_RW if writable_only else _PROPERTY_NAMES):
+            address = "/live/arrangement_clip/" + verb + "/" + prop
+            args = (_PROPERTY_IDS[prop],) if verb == "get" else (prop,)
+            handlers.append((address, method_name, args, pass_clip_index))
+    return tuple(handlers)
+
+_PROPERTY_HANDLERS = _build_property_handlers()
+
+def _find_clip_index_at(start_times: List[float], t: float, eps: float = 1e-3) -> Optional[int]:
+    """
+    Returns the index of the first clip starting within `eps` of time `t`, or None.
+
+    `start_times` must be sorted in ascending order, which holds for the start times of
+    track.arrangement_clips as Live keeps arrangement clips ordered by position.
+    """
+    index = bisect.bisect_left(start_times, t - eps)
+    if index < len(start_times) and abs(start_times[index] - t) < eps:
+        return index
+    return None
+
+def _find_clip_after_op(arrangement_clips, new_clip, t: float) -> Optional[int]:
+    """
+    Returns the index of `new_clip` (as returned by track.duplicate_clip_to_arrangement)
+    in `arrangement_clips`. Falls back to locating the first clip starting at time `t`
+    if `new_clip` is None (on Live versions where duplicate_clip_to_arrangement returns
+    None) or if no clip compares equal to it.
+    """
+    if new_clip is not None:
+        index = next((i for i, ac in enumerate(arrangement_clips) if ac == new_clip), None)
+        if index is not None:
+            return index
+    start_times = [ac.start_time for ac in arrangement_clips]
+    return _find_clip_index_at(start_times, t)
+
+
+class _ArrangementClipCallback:
+    """
+    OSC callback that expects:
+      (track_index, clip_index, *args)
+
+    Resolves the clip via the handler's cached track.arrangement_clips[clip_index],
+    and calls `func` with the clip plus any additional `args`.
+
+    Implemented as a slotted class rather than a closure, as one instance is
+    registered per property and verb.
+
+    Replies are written straight to the OSC socket at `address` via send_reply(),
+    rather than returned to the OSC server to be re-packed into a message.
+    """
+    __slots__ = ("handler", "address", "func", "args", "pass_clip_index")
+
+    def __init__(self, handler, address: str, func, args: Tuple = (), pass_clip_index: bool = False):
+        self.handler = handler
+        self.address = address
+        self.func = func
+        self.args = args
+        self.pass_clip_index = pass_clip_index
+
+    def __call__(self, params: Tuple[Any]) -> None:
+        #--------------------------------------------------------------------------------
+        # Cast to int to support clients such as TouchOSC that, by default, pass all
+        # numeric arguments as float.
+        #--------------------------------------------------------------------------------
+        track_index, clip_index = int(params[0]), int(params[1])
+        _, arrangement_clips = self.handler._get_arrangement_clips(track_index)
+        clip = arrangement_clips[clip_index]
+        if self.pass_clip_index:
+            #--------------------------------------------------------------------------------
+            # Pass the parsed indices rather than the raw params, so that the listener key
+            # and listener replies are always (track_index, clip_index) as ints, regardless
+            # of trailing args or clients that send indices as floats.
+            #--------------------------------------------------------------------------------
+            rv = self.func(clip, *self.args, (track_index, clip_index))
+        else:
+            rv = self.func(clip, *self.args, tuple(params[2:]))
+
+        if rv is not None:
+            self.handler.osc_server.send_reply(self.address, (track_index, clip_index, *rv))
 
 
 class ArrangementClipHandler(AbletonOSCHandler):
@@ -8,59 +137,65 @@ class ArrangementClipHandler(AbletonOSCHandler):
         super().__init__(manager)
         self.class_identifier = "arrangement_clip"
 
-    def init_api(self):
-        def create_arrangement_clip_callback(func, *args, pass_clip_index=False):
-            """
-            Creates a callback that expects:
-              (track_index, clip_index, *args)
+        #--------------------------------------------------------------------------------
+        # Cache of track_index -> (track, track.arrangement_clips), so that repeated
+        # queries on the same track don't have to cross into the Live API to re-resolve
+        # the track and its clip list. The whole cache is invalidated by a listener on
+        # song.tracks; a track's entry is invalidated by a listener on its
+        # arrangement_clips, and explicitly after each mutating operation.
+        # _cache_listener_subjects holds (subject, prop, listener) for cleanup.
+        #--------------------------------------------------------------------------------
+        self._track_cache = {}
+        self._tracks_listener = self._clear_track_cache
+        self._cache_listener_subjects = []
+
+        #--------------------------------------------------------------------------------
+        # track_index -> index of the session clip slot last used (and emptied again)
+        # by create_arrangement_clip. Always re-checked with has_clip before use.
+        #--------------------------------------------------------------------------------
+        self._empty_slot_hint = {}
+
+        #--------------------------------------------------------------------------------
+        # Listener updates are coalesced: a property change only marks its listener key
+        # as dirty, and dirty keys are flushed at most once per tick, skipping values
+        # that are unchanged since they were last sent. (A dict is used as an
+        # insertion-ordered set.)
+        #--------------------------------------------------------------------------------
+        self._dirty_listener_keys = {}
+        self._last_sent_values = {}
+        self._flush_scheduled = False
 
-            Resolves clip via track.arrangement_clips[clip_index].
-            """
-            def arrangement_clip_callback(params: Tuple[Any]) -> Tuple:
-                track_index, clip_index = int(params[0]), int(params[1])
-                track = self.song.tracks[track_index]
-                if not hasattr(track, 'arrangement_clips'):
-                    raise RuntimeError("arrangement_clips not available (requires Live 11+)")
-                clip = track.arrangement_clips[clip_index]
-                if pass_clip_index:
-                    rv = func(clip, *args, tuple(params[0:]))
-                else:
-                    rv = func(clip, *args, tuple(params[2:]))
-
-                if rv is not None:
-                    return (track_index, clip_index, *rv)
-
-            return arrangement_clip_callback
+    def init_api(self):
+        #--------------------------------------------------------------------------------
+        # arrangement_clips is invariant for a given Live version, so probe for it once
+        # here rather than on every OSC message. Don't raise, as that would prevent the
+        # remaining handlers from being created.
+        #--------------------------------------------------------------------------------
+        if not hasattr(Live.Track.Track, "arrangement_clips"):
+            self.logger.warning("arrangement_clips not available (requires Live 11+), not registering /live/arrangement_clip handlers")
+            return
 
         # -------------------------------------------------------------------
         # Clip-level properties
         # -------------------------------------------------------------------
-        properties_r = [
-            "start_time",
-            "end_time",
-            "length",
-            "is_midi_clip",
-            "color",
-        ]
-        properties_rw = [
-            "name",
-            "loop_start",
-            "loop_end",
-            "start_marker",
-            "end_marker",
-            "looping",
-        ]
-
-        for prop in properties_r + properties_rw:
-            self.osc_server.add_handler("/live/arrangement_clip/get/%s" % prop,
-                                        create_arrangement_clip_callback(self._get_property, prop))
-            self.osc_server.add_handler("/live/arrangement_clip/start_listen/%s" % prop,
-                                        create_arrangement_clip_callback(self._start_listen, prop, pass_clip_index=True))
-            self.osc_server.add_handler("/live/arrangement_clip/stop_listen/%s" % prop,
-                                        create_arrangement_clip_callback(self._stop_listen, prop, pass_clip_index=True))
-        for prop in properties_rw:
-            self.osc_server.add_handler("/live/arrangement_clip/set/%s" % prop,
-                                        create_arrangement_clip_callback(self._set_property, prop))
+        for address, method_name, args, pass_clip_index in _PROPERTY_HANDLERS:
+            self._add_clip_handler(address, getattr(self, method_name), *args, pass_clip_index=pass_clip_index)
+
+        def clip_get_properties(clip, params: Tuple[Any] = ()):
+            """
+            Query several properties of a clip in a single message.
+            Params: prop_name, [prop_name, ...]
+            Returns: prop_name, value, [prop_name, value, ...]
+            """
+            rv = []
+            for prop in params:
+                prop_id = _PROPERTY_IDS.get(prop)
+                if prop_id is None:
+                    raise ValueError("Unknown arrangement clip property: %s" % prop)
+                rv += (prop, *self._get_property_by_id(clip, prop_id))
+            return tuple(rv)
+
+        self._add_clip_handler("/live/arrangement_clip/get_properties", clip_get_properties)
 
         # -------------------------------------------------------------------
         # MIDI Notes — same flat-tuple format as /live/clip/ notes
@@ -73,21 +208,17 @@ class ArrangementClipHandler(AbletonOSCHandler):
             else:
                 raise ValueError("Invalid number of arguments for get/notes. Either 0 or 4 arguments must be passed.")
             notes = clip.get_notes_extended(pitch_start, pitch_span, time_start, time_span)
-            all_note_attributes = []
-            for note in notes:
-                all_note_attributes += [note.pitch, note.start_time, note.duration, note.velocity, note.mute]
-            return tuple(all_note_attributes)
+            return tuple(chain.from_iterable(map(_get_note_attributes, notes)))
 
         def clip_add_notes(clip, params: Tuple[Any] = ()):
-            notes = []
-            for offset in range(0, len(params), 5):
-                pitch, start_time, duration, velocity, mute = params[offset:offset + 5]
-                note = Live.Clip.MidiNoteSpecification(start_time=start_time,
-                                                       duration=duration,
-                                                       pitch=pitch,
-                                                       velocity=velocity,
-                                                       mute=mute)
-                notes.append(note)
+            if len(params) % 5 != 0:
+                raise ValueError("Invalid number of arguments for add/notes. Arguments must be passed in groups of 5 (pitch, start_time, duration, velocity, mute).")
+            notes = [_MidiNoteSpec(start_time=params[offset + 1],
+                                   duration=params[offset + 2],
+                                   pitch=params[offset],
+                                   velocity=params[offset + 3],
+                                   mute=params[offset + 4])
+                     for offset in range(0, len(params), 5)]
             clip.add_new_notes(tuple(notes))
 
         def clip_remove_notes(clip, params: Tuple[Any] = ()):
@@ -99,13 +230,18 @@ class ArrangementClipHandler(AbletonOSCHandler):
                 raise ValueError("Invalid number of arguments for remove/notes. Either 0 or 4 arguments must be passed.")
             clip.remove_notes_extended(pitch_start, pitch_span, time_start, time_span)
 
-        self.osc_server.add_handler("/live/arrangement_clip/get/notes", create_arrangement_clip_callback(clip_get_notes))
-        self.osc_server.add_handler("/live/arrangement_clip/add/notes", create_arrangement_clip_callback(clip_add_notes))
-        self.osc_server.add_handler("/live/arrangement_clip/remove/notes", create_arrangement_clip_callback(clip_remove_notes))
+        self._add_clip_handler("/live/arrangement_clip/get/notes", clip_get_notes)
+        self._add_clip_handler("/live/arrangement_clip/add/notes", clip_add_notes)
+        self._add_clip_handler("/live/arrangement_clip/remove/notes", clip_remove_notes)
 
         # -------------------------------------------------------------------
         # Track-level arrangement clip operations
         # Uses standalone callbacks with track_index prefix.
+        #
+        # Indices are still cast to int, to support clients such as TouchOSC
+        # that send all numeric arguments as float. Times and lengths are
+        # passed through as received, as both the Live API and the arithmetic
+        # below accept either int or float.
         # -------------------------------------------------------------------
 
         def create_arrangement_clip(params: Tuple[Any]):
@@ -116,27 +252,31 @@ class ArrangementClipHandler(AbletonOSCHandler):
             then cleans up the session clip.
             """
             track_index = int(params[0])
-            start_time = float(params[1])
-            length = float(params[2])
+            start_time = params[1]
+            length = params[2]
             track = self.song.tracks[track_index]
 
-            empty_slot = None
-            for i, slot in enumerate(track.clip_slots):
-                if not slot.has_clip:
-                    empty_slot = (i, slot)
-                    break
-            if empty_slot is None:
-                raise RuntimeError("No empty clip slot available for arrangement clip creation")
-            slot_index, slot = empty_slot
+            #--------------------------------------------------------------------------------
+            # Try the slot used last time first, as it is emptied again after each call,
+            # and only fall back to scanning for an empty slot if it has since been filled.
+            #--------------------------------------------------------------------------------
+            clip_slots = track.clip_slots
+            slot_index = self._empty_slot_hint.get(track_index)
+            if slot_index is None or slot_index >= len(clip_slots) or clip_slots[slot_index].has_clip:
+                slot_index = next((i for i, slot in enumerate(clip_slots) if not slot.has_clip), None)
+                if slot_index is None:
+                    raise RuntimeError("No empty clip slot available for arrangement clip creation")
+            slot = clip_slots[slot_index]
             slot.create_clip(length)
             clip = slot.clip
-            track.duplicate_clip_to_arrangement(clip, start_time)
+            new_clip = track.duplicate_clip_to_arrangement(clip, start_time)
             slot.delete_clip()
+            self._empty_slot_hint[track_index] = slot_index
+            self._invalidate_track_cache(track_index)
 
-            for i, ac in enumerate(track.arrangement_clips):
-                if abs(ac.start_time - start_time) < 0.001:
-                    return (track_index, i)
-            return (track_index, -1)
+            _, arrangement_clips = self._get_arrangement_clips(track_index)
+            index = _find_clip_after_op(arrangement_clips, new_clip, start_time)
+            return (track_index, -1) if index is None else (track_index, index)
 
         def delete_arrangement_clip(params: Tuple[Any]):
             """Delete an arrangement clip.
@@ -144,9 +284,10 @@ class ArrangementClipHandler(AbletonOSCHandler):
             """
             track_index = int(params[0])
             clip_index = int(params[1])
-            track = self.song.tracks[track_index]
-            clip = track.arrangement_clips[clip_index]
+            track, arrangement_clips = self._get_arrangement_clips(track_index)
+            clip = arrangement_clips[clip_index]
             track.delete_clip(clip)
+            self._invalidate_track_cache(track_index)
 
         def duplicate_to_arrangement(params: Tuple[Any]):
             """Copy a session clip to the arrangement at dest_time.
@@ -154,62 +295,68 @@ class ArrangementClipHandler(AbletonOSCHandler):
             """
             track_index = int(params[0])
             clip_slot_id = int(params[1])
-            dest_time = float(params[2])
+            dest_time = params[2]
             track = self.song.tracks[track_index]
             clip_slot = track.clip_slots[clip_slot_id]
             if not clip_slot.has_clip:
                 raise RuntimeError("No clip in slot %d" % clip_slot_id)
             clip = clip_slot.clip
-            track.duplicate_clip_to_arrangement(clip, dest_time)
+            new_clip = track.duplicate_clip_to_arrangement(clip, dest_time)
+            self._invalidate_track_cache(track_index)
             # Find the new clip at dest_time
-            for i, ac in enumerate(track.arrangement_clips):
-                if abs(ac.start_time - dest_time) < 0.001:
-                    return (track_index, i)
-            return (track_index,)
+            _, arrangement_clips = self._get_arrangement_clips(track_index)
+            index = _find_clip_after_op(arrangement_clips, new_clip, dest_time)
+            return (track_index,) if index is None else (track_index, index)
 
         def split_arrangement_clip(params: Tuple[Any]):
             """Split an arrangement clip at split_time.
             Params: track_id, clip_id, split_time
             Returns: track_id, original_clip_id, new_clip_id
+
+            A split_time at (or within 1ms of) the clip's start or end leaves the
+            clip unchanged and returns: track_id, clip_id, -1
+            A split_time outside the clip raises ValueError.
             """
             track_index = int(params[0])
             clip_index = int(params[1])
-            split_time = float(params[2])
-            track = self.song.tracks[track_index]
-            clip = track.arrangement_clips[clip_index]
+            split_time = params[2]
+            track, arrangement_clips = self._get_arrangement_clips(track_index)
+            clip = arrangement_clips[clip_index]
 
             orig_start = clip.start_time
             orig_end = clip.end_time
 
-            if split_time <= orig_start or split_time >= orig_end:
+            #--------------------------------------------------------------------------------
+            # A split at (or within 1ms of) either edge of the clip is a no-op, typically
+            # caused by a client re-sending the same split. Return without duplicating.
+            #--------------------------------------------------------------------------------
+            if abs(split_time - orig_start) < 1e-3 or abs(orig_end - split_time) < 1e-3:
+                return (track_index, clip_index, -1)
+            if split_time < orig_start or split_time > orig_end:
                 raise ValueError("split_time must be within clip bounds (%f, %f)" % (orig_start, orig_end))
+            offset = split_time - orig_start
 
             # Duplicate the clip to the split position
             track.duplicate_clip_to_arrangement(clip, split_time)
+            self._invalidate_track_cache(track_index)
 
             # Re-fetch clips since indices may have changed
             # Find original clip (starts at orig_start) and trim its end
-            orig_clip = None
-            new_clip = None
-            orig_idx = None
-            new_idx = None
-            for i, ac in enumerate(track.arrangement_clips):
-                if abs(ac.start_time - orig_start) < 0.001 and orig_clip is None:
-                    orig_clip = ac
-                    orig_idx = i
-                elif abs(ac.start_time - split_time) < 0.001 and new_clip is None:
-                    new_clip = ac
-                    new_idx = i
+            _, arrangement_clips = self._get_arrangement_clips(track_index)
+            start_times = [ac.start_time for ac in arrangement_clips]
+            orig_idx = _find_clip_index_at(start_times, orig_start)
+            new_idx = _find_clip_index_at(start_times, split_time)
+            orig_clip = arrangement_clips[orig_idx] if orig_idx is not None else None
+            new_clip = arrangement_clips[new_idx] if new_idx is not None else None
 
             if orig_clip:
                 # Trim original to end at split point
-                orig_clip.end_marker = split_time - orig_start
+                orig_clip.end_marker = offset
                 if orig_clip.looping:
-                    orig_clip.loop_end = split_time - orig_start
+                    orig_clip.loop_end = offset
 
             if new_clip:
                 # Trim new clip's start
-                offset = split_time - orig_start
                 new_clip.start_marker = offset
                 if new_clip.looping:
                     new_clip.loop_start = offset
@@ -224,21 +371,24 @@ class ArrangementClipHandler(AbletonOSCHandler):
             """
             track_index = int(params[0])
             clip_index = int(params[1])
-            new_start = float(params[2])
-            track = self.song.tracks[track_index]
-            clip = track.arrangement_clips[clip_index]
-
-            # Duplicate to new position, then delete original
-            track.duplicate_clip_to_arrangement(clip, new_start)
-            # Re-fetch the original clip (it's still at the old position)
-            old_clip = track.arrangement_clips[clip_index]
-            track.delete_clip(old_clip)
+            new_start = params[2]
+            track, arrangement_clips = self._get_arrangement_clips(track_index)
+            clip = arrangement_clips[clip_index]
+
+            #--------------------------------------------------------------------------------
+            # Duplicate to new position, then delete original. The original clip handle
+            # remains valid after duplication, so delete it directly rather than re-fetching
+            # by clip_index, which no longer refers to it if new_start is earlier than the
+            # original position.
+            #--------------------------------------------------------------------------------
+            new_clip = track.duplicate_clip_to_arrangement(clip, new_start)
+            track.delete_clip(clip)
+            self._invalidate_track_cache(track_index)
 
             # Find the new clip
-            for i, ac in enumerate(track.arrangement_clips):
-                if abs(ac.start_time - new_start) < 0.001:
-                    return (track_index, i)
-            return (track_index, -1)
+            _, arrangement_clips = self._get_arrangement_clips(track_index)
+            index = _find_clip_after_op(arrangement_clips, new_clip, new_start)
+            return (track_index, -1) if index is None else (track_index, index)
 
         def duplicate_arrangement_clip(params: Tuple[Any]):
             """Duplicate an arrangement clip to dest_time.
@@ -247,14 +397,14 @@ class ArrangementClipHandler(AbletonOSCHandler):
             """
             track_index = int(params[0])
             clip_index = int(params[1])
-            dest_time = float(params[2])
-            track = self.song.tracks[track_index]
-            clip = track.arrangement_clips[clip_index]
-            track.duplicate_clip_to_arrangement(clip, dest_time)
-            for i, ac in enumerate(track.arrangement_clips):
-                if abs(ac.start_time - dest_time) < 0.001:
-                    return (track_index, i)
-            return (track_index, -1)
+            dest_time = params[2]
+            track, arrangement_clips = self._get_arrangement_clips(track_index)
+            clip = arrangement_clips[clip_index]
+            new_clip = track.duplicate_clip_to_arrangement(clip, dest_time)
+            self._invalidate_track_cache(track_index)
+            _, arrangement_clips = self._get_arrangement_clips(track_index)
+            index = _find_clip_after_op(arrangement_clips, new_clip, dest_time)
+            return (track_index, -1) if index is None else (track_index, index)
 
         self.osc_server.add_handler("/live/track/create_arrangement_clip", create_arrangement_clip)
         self.osc_server.add_handler("/live/track/delete_arrangement_clip", delete_arrangement_clip)
@@ -262,3 +412,167 @@ class ArrangementClipHandler(AbletonOSCHandler):
         self.osc_server.add_handler("/live/track/split_arrangement_clip", split_arrangement_clip)
         self.osc_server.add_handler("/live/track/move_arrangement_clip", move_arrangement_clip)
         self.osc_server.add_handler("/live/track/duplicate_arrangement_clip", duplicate_arrangement_clip)
+
+    def _add_clip_handler(self, address: str, func, *args, pass_clip_index: bool = False) -> None:
+        self.osc_server.add_handler(address, _ArrangementClipCallback(self, address, func, args, pass_clip_index))
+
+    def _get_property_by_id(self, clip, prop_id: int, params: Optional[Tuple] = ()) -> Tuple[Any]:
+        """
+        Equivalent of _get_property(), taking an index into _PROPERTY_NAMES and using
+        the corresponding precompiled attrgetter.
+        """
+        try:
+            value = _PROPERTY_GETTERS[prop_id](clip)
+        except RuntimeError:
+            value = None
+        self.logger.info("Getting property for %s: %s = %s", self.class_identifier, _PROPERTY_NAMES[prop_id], value)
+        return (value, *params)
+
+    def clear_api(self):
+        super().clear_api()
+        self._clear_cache_listeners()
+        self._dirty_listener_keys = {}
+        self._last_sent_values = {}
+        self._empty_slot_hint = {}
+
+    #--------------------------------------------------------------------------------
+    # Coalesced listeners
+    #--------------------------------------------------------------------------------
+    def _start_listen(self, target, prop, params: Optional[Tuple] = ()) -> None:
+        """
+        Start listening for the property named `prop` on the clip `target`.
+        `params` is the (track_index, clip_index) tuple.
+
+        Unlike AbletonOSCHandler._start_listen(), changes are not sent from within the
+        Live listener. Instead, the listener marks the property as dirty and schedules a
+        flush for the current tick, so that bursts of changes (e.g. during playback or
+        automation) result in at most one update per property per tick.
+        """
+        listener_key = (prop, tuple(params))
+        if listener_key in self.listener_functions:
+            self._stop_listen(target, prop, params)
+
+        def property_changed_callback():
+            self._dirty_listener_keys[listener_key] = True
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.manager.schedule_message(0, self._flush_listener_updates)
+
+        self.logger.info("Adding listener for %s %s, property: %s" % (self.class_identifier, str(params), prop))
+        add_listener_function = getattr(target, "add_%s_listener" % prop)
+        add_listener_function(property_changed_callback)
+        self.listener_functions[listener_key] = property_changed_callback
+        self.listener_objects[listener_key] = target
+
+        #--------------------------------------------------------------------------------
+        # Immediately send the current value
+        #--------------------------------------------------------------------------------
+        self._send_listener_updates([listener_key])
+
+    def _stop_listen(self, target, prop, params: Optional[Tuple[Any]] = ()) -> None:
+        listener_key = (prop, tuple(params))
+        self._dirty_listener_keys.pop(listener_key, None)
+        self._last_sent_values.pop(listener_key, None)
+        super()._stop_listen(target, prop, params)
+
+    def _flush_listener_updates(self) -> None:
+        """
+        Send the current value of each dirty listened property. Scheduled via
+        manager.schedule_message() by the listener callbacks.
+        """
+        self._flush_scheduled = False
+        dirty_listener_keys = self._dirty_listener_keys
+        self._dirty_listener_keys = {}
+        self._send_listener_updates(dirty_listener_keys)
+
+    def _send_listener_updates(self, listener_keys) -> None:
+        """
+        Send the current value of each of the given listened properties whose value has
+        changed since it was last sent. More than one update is sent as a single OSC bundle.
+
+        Errors are logged rather than raised: when called from _flush_listener_updates(),
+        this runs outside OSCServer.process()'s error handling, within Live's
+        scheduled-message processing, which also drives Manager.tick().
+        """
+        try:
+            messages = []
+            for listener_key in listener_keys:
+                target = self.listener_objects.get(listener_key)
+                if target is None:
+                    continue
+                prop, params = listener_key
+                try:
+                    value = _PROPERTY_GETTERS[_PROPERTY_IDS[prop]](target)
+                except RuntimeError as e:
+                    #--------------------------------------------------------------------------------
+                    # The clip may have been deleted since the change was observed.
+                    #--------------------------------------------------------------------------------
+                    self.logger.info("Couldn't read property %s of %s %s (likely benign): %s" % (prop, self.class_identifier, str(params), e))
+                    continue
+                if listener_key in self._last_sent_values and self._last_sent_values[listener_key] == value:
+                    continue
+                self._last_sent_values[listener_key] = value
+                self.logger.info("Property %s changed of %s %s: %s" % (prop, self.class_identifier, str(params), value))
+                messages.append(("/live/%s/get/%s" % (self.class_identifier, prop), (*params, value)))
+
+            if len(messages) == 1:
+                self.osc_server.send_reply(*messages[0])
+            elif messages:
+                self.osc_server.send_bundle(messages)
+        except Exception as e:
+            self.logger.error("AbletonOSC: Error sending listener updates: %s" % e)
+            self.logger.warning("AbletonOSC: %s" % traceback.format_exc())
+
+    #--------------------------------------------------------------------------------
+    # Track / arrangement clip cache
+    #--------------------------------------------------------------------------------
+    def _get_arrangement_clips(self, track_index: int) -> Tuple[Any, Any]:
+        """
+        Returns (track, track.arrangement_clips) for the track at track_index, using
+        the cached value where available.
+        """
+        cached = self._track_cache.get(track_index)
+        if cached is None:
+            track = self.song.tracks[track_index]
+            self._add_cache_listeners(track)
+            cached = (track, track.arrangement_clips)
+            self._track_cache[track_index] = cached
+        return cached
+
+    def _invalidate_track_cache(self, track_index: int) -> None:
+        self._track_cache.pop(track_index, None)
+
+    def _invalidate_cached_track(self, track) -> None:
+        for track_index, (cached_track, _) in list(self._track_cache.items()):
+            if cached_track == track:
+                del self._track_cache[track_index]
+
+    def _clear_track_cache(self) -> None:
+        self._track_cache = {}
+
+    def _add_cache_listeners(self, track) -> None:
+        if not self.song.tracks_has_listener(self._tracks_listener):
+            self.song.add_tracks_listener(self._tracks_listener)
+            self._cache_listener_subjects.append((self.song, "tracks", self._tracks_listener))
+
+        for subject, prop, _ in self._cache_listener_subjects:
+            if prop == "arrangement_clips" and subject == track:
+                return
+
+        def arrangement_clips_changed():
+            self._invalidate_cached_track(track)
+
+        track.add_arrangement_clips_listener(arrangement_clips_changed)
+        self._cache_listener_subjects.append((track, "arrangement_clips", arrangement_clips_changed))
+
+    def _clear_cache_listeners(self) -> None:
+        for subject, prop, listener in self._cache_listener_subjects:
+            try:
+                getattr(subject, "remove_%s_listener" % prop)(listener)
+            except Exception as e:
+                #--------------------------------------------------------------------------------
+                # The subject may no longer exist (e.g. a track that has since been deleted).
+                #--------------------------------------------------------------------------------
+                self.logger.info("Exception whilst removing cache listener (likely benign): %s" % e)
+        self._cache_listener_subjects = []
+        self._clear_track_cache()
@@ -1,12 +1,15 @@
-from typing import Tuple, Any, Callable
+from typing import Tuple, Any, Callable, Iterable
 from .constants import OSC_LISTEN_PORT, OSC_RESPONSE_PORT
 from ..pythonosc.osc_message import OscMessage, ParseError
 from ..pythonosc.osc_bundle import OscBundle
 from ..pythonosc.osc_message_builder import OscMessageBuilder, BuildError
+from ..pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
+from ..pythonosc.parsing import osc_types
 
 import re
 import errno
 import socket
+import struct
 import logging
 import traceback
 
@@ -83,6 +86,104 @@ class OSCServer:
         except BuildError:
             self.logger.error("AbletonOSC: OSC build error: %s" % (traceback.format_exc()))
 
+    def send_bundle(self,
+                    messages: Iterable[Tuple[str, Tuple]],
+                    remote_addr: Tuple[str, int] = None) -> None:
+        """
+        Send several OSC messages as a single OSC bundle (and so a single datagram),
+        timetagged for immediate processing.
+
+        Args:
+            messages: An iterable of (address, params) pairs
+            remote_addr: The remote address to send to, as a 2-tuple (hostname, port).
+                         If None, uses the default remote address.
+        """
+        bundle_builder = OscBundleBuilder(IMMEDIATELY)
+        try:
+            for address, params in messages:
+                msg_builder = OscMessageBuilder(address)
+                for param in params:
+                    msg_builder.add_arg(param)
+                bundle_builder.add_content(msg_builder.build())
+            bundle = bundle_builder.build()
+            if remote_addr is None:
+                remote_addr = self._remote_addr
+            self._socket.sendto(bundle.dgram, remote_addr)
+        except BuildError:
+            self.logger.error("AbletonOSC: OSC build error: %s" % (traceback.format_exc()))
+
+    def send_reply(self,
+                   address: str,
+                   params: Iterable = (),
+                   remote_addr: Tuple[str, int] = None) -> None:
+        """
+        Send an OSC message, packing the params directly into the datagram with a single
+        struct.pack() call. This skips OscMessageBuilder's per-arg list and the re-parse
+        of the built datagram, and is intended for high-rate replies such as listener updates.
+
+        Supports int, float, str, bool and None params. Messages containing any other
+        param type, or values that can't be packed this way, are sent via send(), so
+        that errors are handled exactly as they are there.
+
+        Args:
+            address: The OSC address (e.g. /frequency)
+            params: An iterable of zero or more OSC params
+            remote_addr: The remote address to send to, as a 2-tuple (hostname, port).
+                         If None, uses the default remote address.
+        """
+        params = tuple(params)
+        type_tags = [","]
+        formats = [">"]
+        values = []
+        for param in params:
+            param_type = type(param)
+            if param_type is int:
+                if -0x80000000 <= param <= 0x7FFFFFFF:
+                    type_tags.append("i")
+                    formats.append("i")
+                else:
+                    type_tags.append("h")
+                    formats.append("q")
+                values.append(param)
+            elif param_type is float:
+                type_tags.append("f")
+                formats.append("f")
+                values.append(param)
+            elif param_type is str:
+                try:
+                    encoded = param.encode("utf-8")
+                except UnicodeEncodeError:
+                    self.send(address, params, remote_addr)
+                    return
+                type_tags.append("s")
+                #--------------------------------------------------------------------------------
+                # OSC strings are null-terminated and padded to a multiple of 4 bytes,
+                # which struct's "Ns" format does by padding with nulls.
+                #--------------------------------------------------------------------------------
+                formats.append("%ds" % ((len(encoded) // 4 + 1) * 4))
+                values.append(encoded)
+            elif param is True:
+                type_tags.append("T")
+            elif param is False:
+                type_tags.append("F")
+            elif param is None:
+                type_tags.append("N")
+            else:
+                self.send(address, params, remote_addr)
+                return
+
+        try:
+            dgram = osc_types.write_string(address) + \
+                    osc_types.write_string("".join(type_tags)) + \
+                    struct.pack("".join(formats), *values)
+        except (osc_types.BuildError, struct.error, OverflowError):
+            self.send(address, params, remote_addr)
+            return
+
+        if remote_addr is None:
+            remote_addr = self._remote_addr
+        self._socket.sendto(dgram, remote_addr)
+
     def process_message(self, message, remote_addr):
         if message.address in self._callbacks:
             callback = self._callbacks[message.address]
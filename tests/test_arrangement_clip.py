@@ -0,0 +1,132 @@
+from . import client, wait_one_tick, TICK_DURATION
+from pythonosc.osc_bundle import OscBundle
+import pytest
+
+#--------------------------------------------------------------------------------
+# To test arrangement clips, initialise by creating an empty MIDI clip at the
+# start of the arrangement on the first (MIDI) track.
+#--------------------------------------------------------------------------------
+@pytest.fixture(scope="module", autouse=True)
+def _create_test_arrangement_clip(client):
+    track_id = 0
+    client.query("/live/track/create_arrangement_clip", (track_id, 0.0, 4.0))
+    yield
+    client.send_message("/live/track/delete_arrangement_clip", (track_id, 0))
+
+#--------------------------------------------------------------------------------
+# Test arrangement clip properties
+#--------------------------------------------------------------------------------
+
+def test_arrangement_clip_property_name(client):
+    for value in ("Alpha", "Beta"):
+        client.send_message("/live/arrangement_clip/set/name", (0, 0, value))
+        wait_one_tick()
+        assert client.query("/live/arrangement_clip/get/name", (0, 0)) == (0, 0, value)
+
+def test_arrangement_clip_get_properties(client):
+    client.send_message("/live/arrangement_clip/set/name", (0, 0, "Alpha"))
+    wait_one_tick()
+    assert client.query("/live/arrangement_clip/get_properties",
+                        (0, 0, "name", "start_time", "length")) == (0, 0,
+                                                                    "name", "Alpha",
+                                                                    "start_time", 0.0,
+                                                                    "length", 4.0)
+
+#--------------------------------------------------------------------------------
+# Test that track-level arrangement operations are processed in order with
+# messages to other handlers received in the same bundle.
+#--------------------------------------------------------------------------------
+
+def test_arrangement_ops_processed_in_bundle_order(client):
+    client.send_message("/live/clip_slot/create_clip", (0, 1, 4.0))
+    wait_one_tick()
+    client.send_bundle([
+        ("/live/track/duplicate_to_arrangement", (0, 1, 16.0)),
+        ("/live/clip_slot/delete_clip", (0, 1)),
+    ])
+    wait_one_tick()
+    assert client.query("/live/clip_slot/get/has_clip", (0, 1)) == (0, 1, False)
+    assert client.query("/live/track/get/arrangement_clips/start_time", (0,)) == (0, 0.0, 16.0)
+
+    client.send_message("/live/track/delete_arrangement_clip", (0, 1))
+    wait_one_tick()
+    assert client.query("/live/track/get/arrangement_clips/start_time", (0,)) == (0, 0.0)
+
+def test_arrangement_clip_listen_lifecycle(client):
+    client.send_message("/live/arrangement_clip/set/name", [0, 0, "Alpha"])
+    wait_one_tick()
+    client.send_message("/live/arrangement_clip/start_listen/name", [0, 0])
+    assert client.await_message("/live/arrangement_clip/get/name", TICK_DURATION * 2) == (0, 0, "Alpha")
+    client.send_message("/live/arrangement_clip/set/name", [0, 0, "Beta"])
+    assert client.await_message("/live/arrangement_clip/get/name", TICK_DURATION * 2) == (0, 0, "Beta")
+
+    # A change that is reverted within the same tick should not send an update
+    client.send_bundle([("/live/arrangement_clip/set/name", (0, 0, "Gamma")),
+                        ("/live/arrangement_clip/set/name", (0, 0, "Beta"))])
+    with pytest.raises(RuntimeError):
+        client.await_message("/live/arrangement_clip/get/name", TICK_DURATION * 2)
+
+    client.send_message("/live/arrangement_clip/stop_listen/name", [0, 0])
+    wait_one_tick()
+    client.send_message("/live/arrangement_clip/set/name", [0, 0, "Alpha"])
+    with pytest.raises(RuntimeError):
+        client.await_message("/live/arrangement_clip/get/name", TICK_DURATION * 2)
+
+def test_arrangement_clip_listen_coalesces_updates(client, monkeypatch):
+    client.send_message("/live/arrangement_clip/set/name", [0, 0, "Alpha"])
+    client.send_message("/live/arrangement_clip/set/looping", [0, 0, True])
+    wait_one_tick()
+    client.send_message("/live/arrangement_clip/start_listen/name", [0, 0])
+    assert client.await_message("/live/arrangement_clip/get/name", TICK_DURATION * 2) == (0, 0, "Alpha")
+    client.send_message("/live/arrangement_clip/start_listen/looping", [0, 0])
+    assert client.await_message("/live/arrangement_clip/get/looping", TICK_DURATION * 2) == (0, 0, True)
+
+    #--------------------------------------------------------------------------------
+    # Record raw datagrams, as the dispatcher unpacks bundles before handlers see them.
+    #--------------------------------------------------------------------------------
+    datagrams = []
+    dispatcher = client.server.dispatcher
+    call_handlers_for_packet = dispatcher.call_handlers_for_packet
+
+    def record_packet(data, client_address):
+        datagrams.append(data)
+        call_handlers_for_packet(data, client_address)
+
+    monkeypatch.setattr(dispatcher, "call_handlers_for_packet", record_packet)
+
+    # Changes to two listened properties in the same tick should arrive as one bundle
+    client.send_bundle([("/live/arrangement_clip/set/name", (0, 0, "Beta")),
+                        ("/live/arrangement_clip/set/looping", (0, 0, False))])
+    assert client.await_message("/live/arrangement_clip/get/looping", TICK_DURATION * 2) == (0, 0, False)
+    wait_one_tick()
+    monkeypatch.undo()
+
+    bundles = [OscBundle(data) for data in datagrams if OscBundle.dgram_is_bundle(data)]
+    assert len(bundles) == 1
+    assert sorted((message.address, tuple(message.params)) for message in bundles[0]) == [
+        ("/live/arrangement_clip/get/looping", (0, 0, False)),
+        ("/live/arrangement_clip/get/name", (0, 0, "Beta")),
+    ]
+
+    client.send_message("/live/arrangement_clip/stop_listen/name", [0, 0])
+    client.send_message("/live/arrangement_clip/stop_listen/looping", [0, 0])
+    client.send_message("/live/arrangement_clip/set/looping", [0, 0, True])
+    wait_one_tick()
+
+def test_arrangement_clip_move_earlier(client):
+    # Move later first, so that the clip can then be moved earlier than its current start
+    assert client.query("/live/track/move_arrangement_clip", (0, 0, 8.0)) == (0, 0)
+    assert client.query("/live/track/get/arrangement_clips/start_time", (0,)) == (0, 8.0)
+
+    assert client.query("/live/track/move_arrangement_clip", (0, 0, 4.0)) == (0, 0)
+    assert client.query("/live/track/get/arrangement_clips/start_time", (0,)) == (0, 4.0)
+
+    client.query("/live/track/move_arrangement_clip", (0, 0, 0.0))
+    assert client.query("/live/track/get/arrangement_clips/start_time", (0,)) == (0, 0.0)
+
+def test_arrangement_clip_split_at_edges(client):
+    # Splitting at either edge of the clip (0.0 .. 4.0) is a no-op
+    assert client.query("/live/track/split_arrangement_clip", (0, 0, 0.0)) == (0, 0, -1)
+    assert client.query("/live/track/split_arrangement_clip", (0, 0, 4.0)) == (0, 0, -1)
+    assert client.query("/live/track/get/arrangement_clips/start_time", (0,)) == (0, 0.0)
+    assert client.query("/live/track/get/arrangement_clips/length", (0,)) == (0, 4.0)
@@ -0,0 +1,71 @@
+import importlib.util
+import os
+import socket
+import sys
+import types
+import pytest
+
+#--------------------------------------------------------------------------------
+# OSCServer doesn't depend on Live, so these tests run without a Live instance.
+# abletonosc/__init__.py imports Live-dependent handlers, so load osc_server.py
+# directly, under a bare package module for abletonosc.
+#--------------------------------------------------------------------------------
+@pytest.fixture(scope="module")
+def osc_server_module():
+    root_package = __package__.rsplit(".", 1)[0]
+    package_name = root_package + ".abletonosc"
+    package_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "abletonosc")
+    saved_modules = {name: sys.modules.get(name) for name in (package_name, package_name + ".osc_server", package_name + ".constants")}
+
+    package = types.ModuleType(package_name)
+    package.__path__ = [package_dir]
+    sys.modules[package_name] = package
+    spec = importlib.util.spec_from_file_location(package_name + ".osc_server", os.path.join(package_dir, "osc_server.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    yield module
+
+    for name, saved_module in saved_modules.items():
+        if saved_module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = saved_module
+
+@pytest.fixture
+def server_and_receiver(osc_server_module):
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(1.0)
+    server = osc_server_module.OSCServer(local_addr=("127.0.0.1", 0),
+                                         remote_addr=receiver.getsockname())
+    yield server, receiver
+    server.shutdown()
+    receiver.close()
+
+#--------------------------------------------------------------------------------
+# send_reply() must produce the same datagram as send()
+#--------------------------------------------------------------------------------
+@pytest.mark.parametrize("params", [
+    (),
+    (0, 1, -5, 0x7FFFFFFF, -0x80000000),
+    (2 ** 40, -(2 ** 40)),
+    (0.5, -1.25, 0.0),
+    ("", "abc", "abcd", "é漢字"),
+    (True, False, None),
+    (0, 1, "name", 0.5, True),
+    (0, 1, b"\x01\x02\x03"),
+])
+def test_send_reply_matches_send(server_and_receiver, params):
+    server, receiver = server_and_receiver
+    server.send("/live/test", params)
+    sent = receiver.recv(65536)
+    server.send_reply("/live/test", iter(params))
+    assert receiver.recv(65536) == sent
+
+def test_send_reply_float_overflow_matches_send(server_and_receiver):
+    server, _ = server_and_receiver
+    with pytest.raises(OverflowError):
+        server.send("/live/test", (1e300,))
+    with pytest.raises(OverflowError):
+        server.send_reply("/live/test", (1e300,))